@@ -217,6 +217,103 @@ def fix_errors_2bit(encoded_data, error_positions):
     return bytes(data_bytes)
 
 
+ADAPTIVE_CHUNK_SIZE = 256
+ADAPTIVE_HEADER_SIZE = 12
+ADAPTIVE_TAG_1BIT = 0x00
+ADAPTIVE_TAG_2BIT = 0xFF
+
+
+def encode_adaptive(data: bytes, chunk_size=ADAPTIVE_CHUNK_SIZE, error_stats=None, error_budget=0) -> bytes:
+    if not 0 < chunk_size < 1 << 16:
+        raise ValueError(f"Chunk size must be between 1 and 65535, got {chunk_size}")
+
+    error_counts = []
+    if error_stats is not None:
+        stats_chunk_size, error_counts = error_stats
+        if stats_chunk_size != chunk_size:
+            raise ValueError(f"Error statistics were collected with chunk size {stats_chunk_size}, got {chunk_size}")
+
+    # The header is the chunk size and data length, protected by the 2-bit code
+    encoded = bytearray(encode_2bit(chunk_size.to_bytes(2, "big") + len(data).to_bytes(4, "big")))
+    for chunk_idx, start in enumerate(range(0, len(data), chunk_size)):
+        chunk = data[start:start + chunk_size]
+        errors = error_counts[chunk_idx] if chunk_idx < len(error_counts) else 0
+
+        if errors > error_budget:
+            encoded.append(ADAPTIVE_TAG_2BIT)
+            encoded.extend(encode_2bit(chunk))
+        else:
+            encoded.append(ADAPTIVE_TAG_1BIT)
+            encoded.extend(encode(chunk))
+
+    return bytes(encoded)
+
+
+def decode_adaptive(encoded_data):
+    _, chunks = split_adaptive_chunks(encoded_data)
+
+    decoded_bytes = bytearray()
+    for uses_2bit, chunk in chunks:
+        if uses_2bit:
+            decoded_bytes.extend(decode_2bit(chunk))
+        else:
+            decoded_bytes.extend(decode(chunk))
+
+    return decoded_bytes
+
+
+def check_adaptive(encoded_data):
+    chunk_size, chunks = split_adaptive_chunks(encoded_data)
+
+    # Counts are codewords with errors, since check cannot tell 1-bit from 2-bit errors
+    error_counts = []
+    for uses_2bit, chunk in chunks:
+        if uses_2bit:
+            error_counts.append(len({i for i, _ in check_2bit(chunk)}))
+        else:
+            error_counts.append(len(check(chunk)))
+
+    return chunk_size, error_counts
+
+
+def split_adaptive_chunks(encoded_data):
+    if len(encoded_data) < ADAPTIVE_HEADER_SIZE:
+        raise ValueError(f"Adaptive data must start with a {ADAPTIVE_HEADER_SIZE}-byte header")
+
+    header = decode_2bit(encoded_data[:ADAPTIVE_HEADER_SIZE])
+    chunk_size = int.from_bytes(header[:2], "big")
+    data_length = int.from_bytes(header[2:], "big")
+    if chunk_size == 0:
+        raise ValueError("Adaptive data has a chunk size of 0")
+
+    chunks = []
+    position = ADAPTIVE_HEADER_SIZE
+    for start in range(0, data_length, chunk_size):
+        if position >= len(encoded_data):
+            raise ValueError(f"Adaptive data is truncated: expected {data_length} bytes, got {start}")
+
+        # Tags are all-zeros or all-ones, so a tag survives up to 3 flipped bits
+        uses_2bit = bin(encoded_data[position]).count("1") > 4
+        position += 1
+
+        chunk_length = min(chunk_size, data_length - start)
+        if uses_2bit:
+            length = chunk_length * 2
+        else:
+            length = (chunk_length * 12 + 7) // 8
+
+        if position + length > len(encoded_data):
+            raise ValueError(f"Adaptive data is truncated: chunk at byte {start} needs {length} bytes")
+
+        chunks.append((uses_2bit, bytes(encoded_data[position:position + length])))
+        position += length
+
+    if position != len(encoded_data):
+        raise ValueError(f"Adaptive data has {len(encoded_data) - position} bytes past the last chunk")
+
+    return chunk_size, chunks
+
+
 def byte_to_bit_array(byte):
     return [int(bit) for bit in f'{byte:08b}']
 
@@ -245,4 +342,209 @@ def extend(array):
             byte_bits += [0] * (8 - len(byte_bits))
         byte_value = int(''.join(map(str, byte_bits)), 2)
         packed_bytes.append(byte_value)
-    return bytes(packed_bytes)
\ No newline at end of file
+    return bytes(packed_bytes)
+
+
+def _parity_table():
+    table = np.zeros(1 << 16, dtype=np.uint8)
+    for bit in range(16):
+        table ^= ((np.arange(1 << 16) >> bit) & 1).astype(np.uint8)
+    return table
+
+
+def _hamming_masks():
+    masks = []
+    for position in [1, 2, 4, 8]:
+        mask = 0
+        for i in get_parity_list(position, 12):
+            mask |= 1 << (11 - i)
+        masks.append(mask)
+    return masks
+
+
+def _2bit_masks():
+    masks = []
+    for row in H_2BIT:
+        mask = 0
+        for i, bit in enumerate(row):
+            mask |= bit << (15 - i)
+        masks.append(mask)
+    return masks
+
+
+def _hamming_corrections():
+    corrections = np.zeros(16, dtype=np.uint16)
+    for error_position in range(1, 13):
+        corrections[error_position] = 1 << (12 - error_position)
+    return corrections
+
+
+def _2bit_corrections():
+    H = np.array(H_2BIT)
+    columns = [int(''.join(map(str, H[:, i])), 2) for i in range(16)]
+    corrections = np.zeros(256, dtype=np.uint16)
+    found = np.zeros(256, dtype=bool)
+
+    # Single bit errors take priority over pairs, as in correct_errors_2bit
+    for i, column in enumerate(columns):
+        if not found[column]:
+            corrections[column] = 1 << (15 - i)
+            found[column] = True
+
+    for i in range(16):
+        for j in range(i + 1, 16):
+            syndrome = columns[i] ^ columns[j]
+            if not found[syndrome]:
+                corrections[syndrome] = (1 << (15 - i)) | (1 << (15 - j))
+                found[syndrome] = True
+
+    corrections[0] = 0
+    return corrections
+
+
+_PARITY = _parity_table()
+_CODES = {
+    12: (_hamming_masks(), _hamming_corrections()),
+    16: (_2bit_masks(), _2bit_corrections()),
+}
+_HAMMING_DATA_BITS = [11 - i for i in [2, 4, 5, 6, 8, 9, 10, 11]]
+
+
+def _check_codeword_bits(codeword_bits):
+    if codeword_bits not in _CODES:
+        raise ValueError(f"Codeword size must be 12 or 16 bits, got {codeword_bits}")
+
+
+class EncodedBuffer:
+    __slots__ = ("codewords", "codeword_bits")
+
+    def __init__(self, codewords, codeword_bits=12):
+        _check_codeword_bits(codeword_bits)
+
+        codewords = np.asarray(codewords)
+        if codewords.ndim != 1:
+            raise ValueError(f"Codewords must be a 1-D array, got {codewords.ndim} dimensions")
+
+        if codewords.size:
+            if not np.issubdtype(codewords.dtype, np.integer):
+                raise TypeError(f"Codewords must be integers, got {codewords.dtype}")
+            if codewords.min() < 0 or codewords.max() >= 1 << codeword_bits:
+                raise ValueError(f"Codewords must fit in {codeword_bits} bits")
+
+        # Copy read-only input so correct() can fix codewords in place
+        self.codewords = codewords.astype(np.uint16, copy=not codewords.flags.writeable)
+        self.codeword_bits = codeword_bits
+
+    @classmethod
+    def _wrap(cls, codewords, codeword_bits):
+        # Skips validation for uint16 arrays already known to fit in codeword_bits
+        buffer = cls.__new__(cls)
+        buffer.codewords = codewords
+        buffer.codeword_bits = codeword_bits
+        return buffer
+
+    @classmethod
+    def encode(cls, data, codeword_bits=12):
+        _check_codeword_bits(codeword_bits)
+        data_bytes = np.frombuffer(bytes(data), dtype=np.uint8).astype(np.uint16)
+
+        if codeword_bits == 12:
+            buffer = cls._wrap(np.zeros(len(data_bytes), dtype=np.uint16), 12)
+            for k, shift in enumerate(_HAMMING_DATA_BITS):
+                buffer.codewords |= ((data_bytes >> (7 - k)) & 1) << shift
+
+            # Each parity bit sits at the position it checks, so the syndrome of
+            # the data-only codeword says exactly which parity bits to set
+            syndromes = buffer.syndromes()
+            for position in [1, 2, 4, 8]:
+                buffer.codewords |= ((syndromes & position) > 0).astype(np.uint16) << (12 - position)
+            return buffer
+
+        buffer = cls._wrap(data_bytes << 8, 16)
+        buffer.codewords |= buffer.syndromes()
+        return buffer
+
+    @classmethod
+    def from_bytes(cls, encoded_data, codeword_bits=12):
+        _check_codeword_bits(codeword_bits)
+        data_bytes = np.frombuffer(bytes(encoded_data), dtype=np.uint8)
+
+        if codeword_bits == 16:
+            codewords = data_bytes[:len(data_bytes) // 2 * 2].view(">u2").astype(np.uint16)
+            return cls._wrap(codewords, 16)
+
+        # Every 3 bytes hold two 12-bit codewords; an odd count leaves a padding nibble
+        count = len(data_bytes) * 8 // 12
+        pairs = count // 2
+        groups = data_bytes[:pairs * 3].reshape(pairs, 3).astype(np.uint16)
+
+        codewords = np.empty(count, dtype=np.uint16)
+        codewords[0:pairs * 2:2] = (groups[:, 0] << 4) | (groups[:, 1] >> 4)
+        codewords[1:pairs * 2:2] = ((groups[:, 1] & 0xF) << 8) | groups[:, 2]
+        if count % 2:
+            codewords[-1] = (int(data_bytes[pairs * 3]) << 4) | (int(data_bytes[pairs * 3 + 1]) >> 4)
+        return cls._wrap(codewords, 12)
+
+    def to_bytes(self):
+        if self.codeword_bits == 16:
+            return self.codewords.astype(">u2").tobytes()
+
+        count = len(self.codewords)
+        pairs = count // 2
+        first = self.codewords[0:pairs * 2:2]
+        second = self.codewords[1:pairs * 2:2]
+
+        packed = np.empty((count * 12 + 7) // 8, dtype=np.uint8)
+        packed[0:pairs * 3:3] = first >> 4
+        packed[1:pairs * 3:3] = ((first & 0xF) << 4) | (second >> 8)
+        packed[2:pairs * 3:3] = second & 0xFF
+        if count % 2:
+            last = int(self.codewords[-1])
+            packed[-2] = last >> 4
+            packed[-1] = (last & 0xF) << 4
+        return packed.tobytes()
+
+    def __len__(self):
+        return len(self.codewords)
+
+    def __getitem__(self, index):
+        codewords = self.codewords[index]
+        if codewords.ndim == 0:
+            return int(codewords)
+        if codewords.ndim != 1:
+            raise TypeError(f"EncodedBuffer index must select a 1-D range of codewords, got {codewords.ndim} dimensions")
+
+        # Slices share the parent's array, integer and boolean arrays select a copy
+        return EncodedBuffer._wrap(codewords, self.codeword_bits)
+
+    def syndromes(self):
+        masks, _ = _CODES[self.codeword_bits]
+
+        syndromes = np.zeros(len(self.codewords), dtype=np.uint16)
+        for mask in masks:
+            syndromes = (syndromes << 1) | _PARITY[self.codewords & mask]
+
+        if self.codeword_bits == 12:
+            # Hamming masks are built for positions 1, 2, 4, 8, so reverse to get the error position
+            return ((syndromes & 1) << 3) | ((syndromes & 2) << 1) | ((syndromes & 4) >> 1) | ((syndromes & 8) >> 3)
+        return syndromes
+
+    def error_masks(self):
+        _, corrections = _CODES[self.codeword_bits]
+        return corrections[self.syndromes()]
+
+    def correct(self):
+        error_masks = self.error_masks()
+        self.codewords ^= error_masks
+        return np.nonzero(error_masks)[0]
+
+    def decode(self):
+        codewords = self.codewords ^ self.error_masks()
+
+        if self.codeword_bits == 16:
+            return bytearray((codewords >> 8).astype(np.uint8).tobytes())
+
+        data_bytes = np.zeros(len(codewords), dtype=np.uint16)
+        for k, shift in enumerate(_HAMMING_DATA_BITS):
+            data_bytes |= ((codewords >> shift) & 1) << (7 - k)
+        return bytearray(data_bytes.astype(np.uint8).tobytes())
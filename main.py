@@ -28,10 +28,42 @@ def display_binary_data(data, bits_per_group=8):
     print(binary_representation.strip())
 
 
+def display_adaptive_errors(error_counts):
+    if any(error_counts):
+        print(f"Errors detected: {sum(error_counts)} codewords with errors found")
+        print("Errors per chunk:", error_counts)
+        print("Errors corrected while decoding")
+    else:
+        print("No errors detected in the data")
+
+
+def load_error_stats():
+    stats_file = input("Enter a previously encoded .aecc file to take error statistics from (leave empty for none): ")
+    if not stats_file:
+        return None
+
+    try:
+        with open(stats_file, "rb") as f:
+            chunk_size, error_counts = hamming.check_adaptive(f.read())
+    except FileNotFoundError:
+        print(f"Error: Statistics file '{stats_file}' not found, encoding without statistics")
+        return None
+    except ValueError as e:
+        print(f"Error: Statistics file '{stats_file}' is not valid adaptive data ({str(e)}), encoding without statistics")
+        return None
+
+    if chunk_size != hamming.ADAPTIVE_CHUNK_SIZE:
+        print(f"Error: Statistics file uses chunk size {chunk_size}, encoding without statistics")
+        return None
+
+    print(f"Error statistics loaded: {sum(1 for count in error_counts if count)} chunks with errors")
+    return chunk_size, error_counts
+
+
 def encode_file(encoding_type):
     input_file = input("Enter a file to encode: ")
-    extension = ".1becc" if encoding_type == "1" else ".2becc"
-    output_file = f"{input_file}{extension}"
+    extensions = {"1": ".1becc", "2": ".2becc", "3": ".aecc"}
+    output_file = f"{input_file}{extensions[encoding_type]}"
 
     try:
         byte_list = []
@@ -44,8 +76,11 @@ def encode_file(encoding_type):
 
         if encoding_type == "1":
             encoded_data = hamming.encode(bytes(byte_list))
-        else:
+        elif encoding_type == "2":
             encoded_data = hamming.encode_2bit(bytes(byte_list))
+        else:
+            error_stats = load_error_stats()
+            encoded_data = hamming.encode_adaptive(bytes(byte_list), error_stats=error_stats)
 
         with open(output_file, 'wb') as f:
             f.write(encoded_data)
@@ -76,8 +111,10 @@ def encode_manual_input(encoding_type):
 
     if encoding_type == "1":
         encoded_data = hamming.encode(data)
-    else:
+    elif encoding_type == "2":
         encoded_data = hamming.encode_2bit(data)
+    else:
+        encoded_data = hamming.encode_adaptive(data, error_stats=load_error_stats())
 
     print("Encoded result:")
     print(encoded_data)
@@ -103,7 +140,8 @@ def decode_manual_input():
     print("Select encoding type:")
     print("1. 1-bit error correction")
     print("2. 2-bit error detection")
-    encoding_type = get_menu_choice(["1", "2"])
+    print("3. Adaptive")
+    encoding_type = get_menu_choice(["1", "2", "3"])
 
     if encoding_type == "1":
         errors = hamming.check(encoded_data)
@@ -117,7 +155,7 @@ def decode_manual_input():
         else:
             print("No errors detected in the data")
             decoded_data = hamming.decode(encoded_data)
-    else:
+    elif encoding_type == "2":
         errors = hamming.check_2bit(encoded_data)
         if errors:
             print(f"Errors detected: {len(errors)} errors found")
@@ -129,6 +167,13 @@ def decode_manual_input():
         else:
             print("No errors detected in the data")
             decoded_data = hamming.decode_2bit(encoded_data)
+    else:
+        try:
+            display_adaptive_errors(hamming.check_adaptive(encoded_data)[1])
+            decoded_data = hamming.decode_adaptive(encoded_data)
+        except ValueError as e:
+            print(f"Error decoding adaptive data: {str(e)}")
+            return
 
     print("Decoded result as bytes:", decoded_data)
 
@@ -148,8 +193,11 @@ def check_and_decode_file():
         elif input_file.endswith(".2becc"):
             encoding_type = "2"
             output_file = input_file[:-6]
+        elif input_file.endswith(".aecc"):
+            encoding_type = "3"
+            output_file = input_file[:-5]
         else:
-            encoding_type = input("File extension not recognized. Enter encoding type (1 or 2): ")
+            encoding_type = input("File extension not recognized. Enter encoding type (1, 2 or 3): ")
             output_file = input("Enter output file name: ")
 
         if encoding_type == "1":
@@ -164,7 +212,7 @@ def check_and_decode_file():
             else:
                 print("No errors detected in the file")
                 decoded_data = hamming.decode(encoded_data)
-        else:
+        elif encoding_type == "2":
             errors = hamming.check_2bit(encoded_data)
             if errors:
                 print(f"Errors detected: {len(errors)} errors found")
@@ -176,6 +224,9 @@ def check_and_decode_file():
             else:
                 print("No errors detected in the file")
                 decoded_data = hamming.decode_2bit(encoded_data)
+        else:
+            display_adaptive_errors(hamming.check_adaptive(encoded_data)[1])
+            decoded_data = hamming.decode_adaptive(encoded_data)
 
         with open(output_file, 'wb') as f:
             f.write(decoded_data)
@@ -198,8 +249,9 @@ def encode_menu():
     print("\nSelect encoding type:")
     print("1. 1-bit error detection")
     print("2. 2-bit error detection")
+    print("3. Adaptive (per-chunk 1-bit or 2-bit)")
 
-    encoding_choice = get_menu_choice(["1", "2"])
+    encoding_choice = get_menu_choice(["1", "2", "3"])
 
     if input_choice == "1":
         encode_file(encoding_choice)
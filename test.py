@@ -7,10 +7,12 @@ from io import BytesIO
 # Import the module (assuming it's saved as hamming_code.py)
 # Replace with proper import if the module has a different name
 import hamming
-from hamming import (encode, decode, encode_2bit, decode_2bit, check, check_2bit, fix_errors, fix_errors_2bit)
+from hamming import (encode, decode, encode_2bit, decode_2bit, check, check_2bit, fix_errors, fix_errors_2bit,
+                     encode_adaptive, decode_adaptive, check_adaptive, split_adaptive_chunks, EncodedBuffer,
+                     ADAPTIVE_HEADER_SIZE)
 
 
-class TestErrorCorrection(unittest.TestCase):
+class HammingTestCase(unittest.TestCase):
     def setUp(self):
         # Test data
         self.test_data = b"Hello, World! This is a test message for error correction."
@@ -21,6 +23,8 @@ class TestErrorCorrection(unittest.TestCase):
         data_bytes[byte_idx] ^= (1 << (7 - bit_idx % 8))
         return bytes(data_bytes)
 
+
+class TestErrorCorrection(HammingTestCase):
     def test_single_bit_error_hamming(self):
         """Test that all possible single bit errors can be corrected with Hamming code."""
         # Encode the original data
@@ -186,5 +190,184 @@ class TestErrorCorrection(unittest.TestCase):
         self.assertEqual(decoded, simple_msg, "Failed to correct specific double bit error in 2-bit code")
 
 
+class TestAdaptiveEncoding(HammingTestCase):
+    chunk_size = 16
+    # Header and tag precede the first chunk's codewords
+    first_chunk_start = (ADAPTIVE_HEADER_SIZE + 1) * 8
+
+    def test_roundtrip(self):
+        """Test that adaptive encoding round-trips with and without error statistics."""
+        for error_counts in ([], [0, 3, 0, 1], [5, 5, 5, 5]):
+            encoded = encode_adaptive(self.test_data, self.chunk_size, (self.chunk_size, error_counts))
+            self.assertEqual(decode_adaptive(encoded), self.test_data)
+            self.assertEqual(check_adaptive(encoded), (self.chunk_size, [0, 0, 0, 0]))
+
+        self.assertEqual(decode_adaptive(encode_adaptive(b"")), b"")
+
+    def test_chunk_code_selection(self):
+        """Test that only chunks above the error budget use the 2-bit code."""
+        error_stats = (self.chunk_size, np.array([0, 3, 1]))
+        _, chunks = split_adaptive_chunks(encode_adaptive(self.test_data, self.chunk_size, error_stats, error_budget=1))
+        self.assertEqual([uses_2bit for uses_2bit, _ in chunks], [False, True, False, False])
+
+        all_1bit = encode_adaptive(self.test_data, self.chunk_size)
+        all_2bit = encode_adaptive(self.test_data, self.chunk_size, (self.chunk_size, [1, 1, 1, 1]))
+        self.assertLess(len(all_1bit), len(all_2bit))
+
+    def test_mismatched_statistics(self):
+        """Test that statistics from a different chunk size are rejected."""
+        error_stats = check_adaptive(encode_adaptive(self.test_data, 8))
+        with self.assertRaises(ValueError):
+            encode_adaptive(self.test_data, self.chunk_size, error_stats)
+
+    def test_error_correction(self):
+        """Test that errors are corrected in both chunk types and counted per codeword."""
+        encoded = encode_adaptive(self.test_data, self.chunk_size, (self.chunk_size, [0, 1]))
+        second_chunk_start = self.first_chunk_start + (self.chunk_size * 12 // 8 + 1) * 8
+
+        # Single error in a 1-bit chunk, double error in the same codeword of a 2-bit chunk
+        corrupted = self.flip_bit(encoded, *divmod(self.first_chunk_start + 5, 8))
+        corrupted = self.flip_bit(corrupted, *divmod(second_chunk_start + 1, 8))
+        corrupted = self.flip_bit(corrupted, *divmod(second_chunk_start + 12, 8))
+
+        self.assertEqual(check_adaptive(corrupted), (self.chunk_size, [1, 1, 0, 0]))
+        self.assertEqual(decode_adaptive(corrupted), self.test_data)
+
+    def test_corrupted_header(self):
+        """Test that any single flipped header bit is corrected."""
+        encoded = encode_adaptive(self.test_data, self.chunk_size, (self.chunk_size, [0, 1]))
+
+        for pos in range(ADAPTIVE_HEADER_SIZE * 8):
+            corrupted = self.flip_bit(encoded, *divmod(pos, 8))
+            self.assertEqual(decode_adaptive(corrupted), self.test_data, f"Failed to correct header bit {pos}")
+
+    def test_corrupted_tag(self):
+        """Test that a chunk tag survives up to 3 flipped bits and misframing is reported."""
+        encoded = encode_adaptive(self.test_data, self.chunk_size, (self.chunk_size, [1]))
+        tag_byte = ADAPTIVE_HEADER_SIZE
+
+        corrupted = encoded
+        for bit_idx in range(3):
+            corrupted = self.flip_bit(corrupted, tag_byte, bit_idx)
+        self.assertEqual(decode_adaptive(corrupted), self.test_data)
+
+        corrupted = self.flip_bit(corrupted, tag_byte, 3)
+        corrupted = self.flip_bit(corrupted, tag_byte, 4)
+        with self.assertRaises(ValueError):
+            decode_adaptive(corrupted)
+
+    def test_wrong_length(self):
+        """Test that truncated or extended data raises instead of decoding short."""
+        encoded = encode_adaptive(self.test_data, self.chunk_size)
+
+        for corrupted in (encoded[:-3], encoded[:-1], encoded + b"\x00", encoded[:ADAPTIVE_HEADER_SIZE - 1]):
+            with self.assertRaises(ValueError):
+                decode_adaptive(corrupted)
+
+
+class TestEncodedBuffer(HammingTestCase):
+    def test_matches_packed_format(self):
+        """Test that the buffer reads and writes the same packed format as encode and encode_2bit."""
+        for codeword_bits, encoder in ((12, encode), (16, encode_2bit)):
+            encoded_data = encoder(self.test_data)
+            buffer = EncodedBuffer.encode(self.test_data, codeword_bits)
+
+            self.assertEqual(buffer.to_bytes(), encoded_data)
+            self.assertEqual(EncodedBuffer.from_bytes(encoded_data, codeword_bits).to_bytes(), encoded_data)
+            self.assertEqual(buffer.decode(), self.test_data)
+            self.assertFalse(buffer.syndromes().any())
+
+    def test_single_bit_errors(self):
+        """Test that every single bit error is corrected for both codes."""
+        for codeword_bits, encoder in ((12, encode), (16, encode_2bit)):
+            encoded_data = encoder(self.test_data)
+
+            for pos in range(len(self.test_data) * codeword_bits):
+                buffer = EncodedBuffer.from_bytes(self.flip_bit(encoded_data, *divmod(pos, 8)), codeword_bits)
+                self.assertEqual(buffer.decode(), self.test_data,
+                                 f"Failed to decode with error at bit {pos} of {codeword_bits}-bit code")
+
+                corrected = buffer.correct()
+                self.assertEqual(corrected.tolist(), [pos // codeword_bits])
+                self.assertEqual(buffer.to_bytes(), encoded_data)
+
+    def test_double_bit_errors_2bit(self):
+        """Test that all double bit errors within a 16-bit codeword are corrected."""
+        encoded_data = encode_2bit(b"A")
+
+        for pos1, pos2 in combinations(range(16), 2):
+            corrupted = self.flip_bit(self.flip_bit(encoded_data, *divmod(pos1, 8)), *divmod(pos2, 8))
+            buffer = EncodedBuffer.from_bytes(corrupted, 16)
+
+            self.assertEqual(buffer.decode(), b"A", f"Failed to correct errors at bits {pos1} and {pos2}")
+            buffer.correct()
+            self.assertEqual(buffer.to_bytes(), encoded_data)
+
+    def test_slicing(self):
+        """Test that slices share codewords with the parent buffer."""
+        buffer = EncodedBuffer.encode(self.test_data, 16)
+        corrupted = EncodedBuffer.from_bytes(self.flip_bit(buffer.to_bytes(), *divmod(5 * 16 + 3, 8)), 16)
+
+        window = corrupted[4:8]
+        self.assertEqual(len(window), 4)
+        self.assertEqual(window.decode(), self.test_data[4:8])
+        self.assertEqual(window.correct().tolist(), [1])
+        self.assertEqual(corrupted[5], buffer[5])
+        self.assertEqual(corrupted.to_bytes(), buffer.to_bytes())
+
+    def test_odd_codeword_count(self):
+        """Test that an odd number of 12-bit codewords round-trips through the padding nibble."""
+        for data in (b"A", b"ABC", self.test_data[:7]):
+            encoded_data = encode(data)
+            buffer = EncodedBuffer.from_bytes(encoded_data, 12)
+
+            self.assertEqual(len(buffer), len(data))
+            self.assertEqual(buffer.decode(), data)
+            self.assertEqual(buffer.to_bytes(), encoded_data)
+            self.assertEqual(EncodedBuffer.encode(data, 12).to_bytes(), encoded_data)
+
+    def test_read_only_codewords(self):
+        """Test that a read-only input array is copied so it can be corrected."""
+        codewords = EncodedBuffer.encode(b"AB", 16).codewords.copy()
+        codewords[0] ^= 1
+        codewords.setflags(write=False)
+
+        buffer = EncodedBuffer(codewords, 16)
+        self.assertEqual(buffer.correct().tolist(), [0])
+        self.assertEqual(buffer.decode(), b"AB")
+
+    def test_array_indexing(self):
+        """Test that list and boolean indexes select a buffer of codewords."""
+        buffer = EncodedBuffer.encode(self.test_data, 16)
+
+        self.assertEqual(buffer[[0, 2]].decode(), self.test_data[0:3:2])
+        self.assertEqual(buffer[buffer.codewords < 0x8000].decode(), bytes(b for b in self.test_data if b < 0x80))
+        with self.assertRaises(TypeError):
+            buffer[None]
+
+    def test_invalid_codeword_size(self):
+        """Test that only the 12-bit and 16-bit codes are accepted."""
+        for codeword_bits in (0, 8):
+            with self.assertRaises(ValueError):
+                EncodedBuffer([], codeword_bits)
+            with self.assertRaises(ValueError):
+                EncodedBuffer.from_bytes(b"\x00\x00", codeword_bits)
+            with self.assertRaises(ValueError):
+                EncodedBuffer.encode(b"A", codeword_bits)
+
+    def test_invalid_codewords(self):
+        """Test that codewords must be a 1-D integer array that fits the codeword size."""
+        with self.assertRaises(ValueError):
+            EncodedBuffer([[1, 2], [3, 4]])
+        with self.assertRaises(ValueError):
+            EncodedBuffer([1 << 12])
+        with self.assertRaises(ValueError):
+            EncodedBuffer([-1], 16)
+        with self.assertRaises(TypeError):
+            EncodedBuffer([1.5])
+
+        self.assertEqual(EncodedBuffer([0xFFFF], 16).to_bytes(), b"\xff\xff")
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file